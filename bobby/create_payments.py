@@ -6,7 +6,7 @@ Payments table links to orders and includes payment details.
 import csv
 import sqlite3
 import random
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 from faker import Faker
 
 fake = Faker()
@@ -16,12 +16,13 @@ random.seed(42)
 # Read orders to create payments for each
 orders = []
 with open('orders.csv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
+    reader = csv.reader(f)
+    next(reader)  # Skip header
+    for order_id, _, order_date, *_, total_amount in reader:
         orders.append({
-            'order_id': int(row['order_id']),
-            'order_date': row['order_date'],
-            'total_amount': float(row['total_amount'])
+            'order_id': int(order_id),
+            'order_date': date.fromisoformat(order_date),
+            'total_amount': float(total_amount)
         })
 
 print(f"Creating payments for {len(orders)} orders...")
@@ -30,15 +31,24 @@ print(f"Creating payments for {len(orders)} orders...")
 payment_methods = ["Credit Card", "Debit Card", "PayPal", "Apple Pay", "Google Pay", "Bank Transfer"]
 payment_statuses = ["Completed", "Completed", "Completed", "Pending", "Failed", "Refunded"]  # Weighted towards Completed
 
-with open('payments.csv', 'w', newline='', encoding='utf-8') as f:
+# Pre-draw every random value up front (at most two payments per order)
+# Most orders have one payment, some might have multiple (partial payments, refunds)
+max_payments = len(orders) * 2
+drawn_num_payments = random.choices((1, 2), weights=(95, 5), k=len(orders))
+drawn_fractions = [random.uniform(0.3, 0.7) for _ in range(len(orders))]
+# Payment date is usually same day or within a few days of order
+payment_delays = [timedelta(days=days) for days in range(4)]
+drawn_delays = random.choices(payment_delays, k=max_payments)
+drawn_methods = random.choices(payment_methods, k=max_payments)
+drawn_statuses = random.choices(payment_statuses, k=max_payments)
+
+with open('payments.csv', 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
     writer = csv.writer(f)
     writer.writerow(['payment_id', 'order_id', 'payment_method', 'payment_date', 'amount', 'payment_status'])
     
+    payment_rows = []
     payment_id = 1
-    for order in orders:
-        # Most orders have one payment, some might have multiple (partial payments, refunds)
-        num_payments = 1 if random.random() < 0.95 else 2
-        
+    for order, num_payments, fraction in zip(orders, drawn_num_payments, drawn_fractions):
         remaining_amount = order['total_amount']
         
         for i in range(num_payments):
@@ -47,30 +57,30 @@ with open('payments.csv', 'w', newline='', encoding='utf-8') as f:
                 amount = round(remaining_amount, 2)
             else:
                 # Partial payment
-                amount = round(remaining_amount * random.uniform(0.3, 0.7), 2)
+                amount = round(remaining_amount * fraction, 2)
                 remaining_amount -= amount
             
-            payment_method = random.choice(payment_methods)
-            # Payment date is usually same day or within a few days of order
-            order_date = datetime.strptime(order['order_date'], '%Y-%m-%d')
-            payment_date = order_date + timedelta(days=random.randint(0, 3))
-            payment_status = random.choice(payment_statuses)
+            payment_method = drawn_methods[payment_id - 1]
+            payment_date = order['order_date'] + drawn_delays[payment_id - 1]
+            payment_status = drawn_statuses[payment_id - 1]
             
-            writer.writerow([
+            payment_rows.append([
                 payment_id,
                 order['order_id'],
                 payment_method,
-                payment_date.strftime('%Y-%m-%d'),
+                payment_date.isoformat(),
                 amount,
                 payment_status
             ])
             payment_id += 1
+    writer.writerows(payment_rows)
 
 print(f"✓ Created payments.csv with {payment_id - 1} payment records")
 
 # Import into database
 print("Importing payments into database...")
 conn = sqlite3.connect('ecom.db')
+conn.isolation_level = None  # Autocommit; transactions are managed explicitly below
 cursor = conn.cursor()
 
 # Create payments table
@@ -86,31 +96,43 @@ cursor.execute('''
     )
 ''')
 
+# Replace existing data and import the new rows in a single transaction,
+# reusing one prepared statement for the inserts
+conn.execute('BEGIN')
+
 # Delete existing data if table already has records
 cursor.execute("SELECT COUNT(*) FROM payments")
 existing_count = cursor.fetchone()[0]
 if existing_count > 0:
     print(f"  Found {existing_count} existing payment records. Deleting...")
     cursor.execute("DELETE FROM payments")
-    conn.commit()
 
-# Import data
+insert_sql = '''
+    INSERT INTO payments (payment_id, order_id, payment_method, payment_date, amount, payment_status)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+BATCH_SIZE = 5000  # Caps memory for very large files
+
 with open('payments.csv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        cursor.execute('''
-            INSERT INTO payments (payment_id, order_id, payment_method, payment_date, amount, payment_status)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (
-            int(row['payment_id']),
-            int(row['order_id']),
-            row['payment_method'],
-            row['payment_date'],
-            float(row['amount']),
-            row['payment_status']
+    reader = csv.reader(f)
+    next(reader)  # Skip header
+    rows = []
+    for payment_id, order_id, payment_method, payment_date, amount, payment_status in reader:
+        rows.append((
+            int(payment_id),
+            int(order_id),
+            payment_method,
+            payment_date,
+            float(amount),
+            payment_status
         ))
+        if len(rows) >= BATCH_SIZE:
+            cursor.executemany(insert_sql, rows)
+            rows = []
+    if rows:
+        cursor.executemany(insert_sql, rows)
 
-conn.commit()
+conn.execute('COMMIT')
 cursor.execute("SELECT COUNT(*) FROM payments")
 count = cursor.fetchone()[0]
 print(f"✓ Imported {count} payments into database")
@@ -5,6 +5,7 @@ and prints the total number of orders and total amount spent by each customer.
 """
 
 import sqlite3
+import sys
 
 def main():
     # Connect to the database
@@ -40,34 +41,37 @@ def main():
     
     # Execute the query
     cursor.execute(query)
-    results = cursor.fetchall()
-    
-    # Prepare data for display
-    headers = ["Customer ID", "Customer Name", "Email", "Total Orders", "Total Amount Spent ($)"]
-    table_data = []
-    
-    for row in results:
-        customer_id, customer_name, email, total_orders, total_amount = row
-        table_data.append([
-            customer_id,
-            customer_name,
-            email,
-            total_orders,
-            f"${total_amount:,.2f}"
-        ])
     
     # Display results in a formatted table
     # Print header
     print(f"{'Customer ID':<12} {'Customer Name':<25} {'Email':<30} {'Orders':<8} {'Total Spent':<15}")
     print("-" * 100)
     
-    # Print data rows
-    for row in table_data:
-        customer_id, customer_name, email, total_orders, total_amount = row
-        # Truncate email if too long
-        email_display = email[:27] + "..." if len(email) > 30 else email
-        customer_name_display = customer_name[:22] + "..." if len(customer_name) > 25 else customer_name
-        print(f"{customer_id:<12} {customer_name_display:<25} {email_display:<30} {total_orders:<8} {total_amount:<15}")
+    # Stream data rows, accumulating the summary statistics as we go
+    total_customers = 0
+    customers_with_orders = 0
+    total_all_orders = 0
+    total_all_revenue = 0
+    
+    while True:
+        rows = cursor.fetchmany(1000)
+        if not rows:
+            break
+        lines = []
+        for customer_id, customer_name, email, total_orders, total_amount in rows:
+            total_customers += 1
+            if total_orders > 0:
+                customers_with_orders += 1
+            total_all_orders += total_orders
+            total_all_revenue += total_amount
+            
+            # Truncate email if too long
+            email_display = email[:27] + "..." if len(email) > 30 else email
+            customer_name_display = customer_name[:22] + "..." if len(customer_name) > 25 else customer_name
+            total_amount_display = f"${total_amount:,.2f}"
+            lines.append(f"{customer_id:<12} {customer_name_display:<25} {email_display:<30} {total_orders:<8} {total_amount_display:<15}")
+        # Write each batch with a single call instead of one print per row
+        sys.stdout.write("\n".join(lines) + "\n")
     
     # Print summary statistics
     print()
@@ -75,32 +79,6 @@ def main():
     print("Summary Statistics:")
     print("-" * 100)
     
-    cursor.execute("SELECT COUNT(*) FROM customers")
-    total_customers = cursor.fetchone()[0]
-    
-    cursor.execute("""
-        SELECT 
-            COUNT(DISTINCT customer_id) as customers_with_orders,
-            SUM(total_orders) as total_all_orders,
-            SUM(total_amount_spent) as total_all_revenue
-        FROM (
-            SELECT 
-                c.customer_id,
-                COUNT(DISTINCT o.order_id) AS total_orders,
-                COALESCE(SUM(p.amount), 0) AS total_amount_spent
-            FROM 
-                customers c
-            LEFT JOIN 
-                orders o ON c.customer_id = o.customer_id
-            LEFT JOIN 
-                payments p ON o.order_id = p.order_id AND p.payment_status = 'Completed'
-            GROUP BY 
-                c.customer_id
-        )
-    """)
-    stats = cursor.fetchone()
-    customers_with_orders, total_all_orders, total_all_revenue = stats
-    
     print(f"Total Customers: {total_customers}")
     print(f"Customers with Orders: {customers_with_orders}")
     print(f"Total Orders: {total_all_orders}")
@@ -5,7 +5,7 @@ Creates 5 CSV files representing a typical e-commerce database schema.
 
 import csv
 import random
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 from faker import Faker
 
 # Initialize Faker
@@ -20,6 +20,28 @@ NUM_CATEGORIES = 15
 NUM_ORDERS = 1000
 MIN_ORDER_ITEMS = 1
 MAX_ORDER_ITEMS = 5
+# Pre-generated Faker values per field, capped by the number of rows drawn from them
+NAME_POOL_SIZE = min(500, NUM_CUSTOMERS)  # First/last names and phone numbers
+ADDRESS_POOL_SIZE = min(300, NUM_CUSTOMERS + NUM_ORDERS)  # Addresses, cities and zip codes
+SMALL_POOL_SIZE = 64  # States and email domains
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB output buffer for the CSV files
+
+# Faker providers are slow, so build a small pool of candidate values once
+# and sample whole columns from it instead of calling Faker for every row
+first_name_pool = [fake.first_name() for _ in range(NAME_POOL_SIZE)]
+last_name_pool = [fake.last_name() for _ in range(NAME_POOL_SIZE)]
+phone_pool = [fake.phone_number() for _ in range(NAME_POOL_SIZE)]
+street_address_pool = [fake.street_address() for _ in range(ADDRESS_POOL_SIZE)]
+city_pool = [fake.city() for _ in range(ADDRESS_POOL_SIZE)]
+zipcode_pool = [fake.zipcode() for _ in range(ADDRESS_POOL_SIZE)]
+state_pool = [fake.state_abbr() for _ in range(SMALL_POOL_SIZE)]
+# Email domains need not be unique, so a small pool is enough
+domain_pool = [fake.domain_name() for _ in range(SMALL_POOL_SIZE)]
+
+def random_dates(days_back, k):
+    """Draw k random dates between days_back days ago and today."""
+    today = date.today()
+    return [today - timedelta(days=offset) for offset in random.choices(range(days_back + 1), k=k)]
 
 # Generate categories first (needed for products)
 categories = []
@@ -33,14 +55,16 @@ print("Generating e-commerce data...")
 
 # 1. Generate categories.csv
 print("1. Generating categories.csv...")
-with open('categories.csv', 'w', newline='', encoding='utf-8') as f:
+with open('categories.csv', 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
     writer = csv.writer(f)
     writer.writerow(['category_id', 'category_name', 'description'])
     
+    category_rows = []
     for i, name in enumerate(category_names, 1):
         description = f"Browse our selection of {name.lower()} products"
-        writer.writerow([i, name, description])
+        category_rows.append([i, name, description])
         categories.append(i)
+    writer.writerows(category_rows)
 
 # 2. Generate products.csv
 print("2. Generating products.csv...")
@@ -63,10 +87,13 @@ product_names = {
     "Furniture": ["Chair", "Table", "Sofa", "Desk", "Bookshelf", "Bed Frame", "Dresser", "Coffee Table"]
 }
 
-with open('products.csv', 'w', newline='', encoding='utf-8') as f:
+created_dates = random_dates(2 * 365, NUM_PRODUCTS)
+
+with open('products.csv', 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
     writer = csv.writer(f)
     writer.writerow(['product_id', 'product_name', 'description', 'price', 'category_id', 'stock_quantity', 'created_date'])
     
+    product_rows = []
     product_id = 1
     for cat_id, cat_name in enumerate(category_names, 1):
         base_names = product_names.get(cat_name, ["Product"])
@@ -82,9 +109,9 @@ with open('products.csv', 'w', newline='', encoding='utf-8') as f:
                 description = f"High-quality {name.lower()} perfect for your needs. Features excellent design and durability."
                 price = round(random.uniform(9.99, 999.99), 2)
                 stock = random.randint(0, 500)
-                created_date = fake.date_between(start_date='-2y', end_date='today')
+                created_date = created_dates[product_id - 1]
                 
-                writer.writerow([product_id, name, description, price, cat_id, stock, created_date])
+                product_rows.append([product_id, name, description, price, cat_id, stock, created_date])
                 products.append(product_id)
                 product_id += 1
                 if product_id > NUM_PRODUCTS:
@@ -93,105 +120,112 @@ with open('products.csv', 'w', newline='', encoding='utf-8') as f:
                 break
         if product_id > NUM_PRODUCTS:
             break
+    writer.writerows(product_rows)
 
 # 3. Generate customers.csv
 print("3. Generating customers.csv...")
-customers = []
-with open('customers.csv', 'w', newline='', encoding='utf-8') as f:
+first_names = random.choices(first_name_pool, k=NUM_CUSTOMERS)
+last_names = random.choices(last_name_pool, k=NUM_CUSTOMERS)
+email_domains = random.choices(domain_pool, k=NUM_CUSTOMERS)
+emails = [f"{first_name}.{last_name}@{domain}".lower()
+          for first_name, last_name, domain in zip(first_names, last_names, email_domains)]
+phones = random.choices(phone_pool, k=NUM_CUSTOMERS)
+addresses = random.choices(street_address_pool, k=NUM_CUSTOMERS)
+cities = random.choices(city_pool, k=NUM_CUSTOMERS)
+states = random.choices(state_pool, k=NUM_CUSTOMERS)
+zip_codes = random.choices(zipcode_pool, k=NUM_CUSTOMERS)
+countries = ["USA"] * NUM_CUSTOMERS
+registration_dates = random_dates(3 * 365, NUM_CUSTOMERS)
+customers = list(range(1, NUM_CUSTOMERS + 1))
+
+with open('customers.csv', 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
     writer = csv.writer(f)
     writer.writerow(['customer_id', 'first_name', 'last_name', 'email', 'phone', 'address', 'city', 'state', 'zip_code', 'country', 'registration_date'])
-    
-    for i in range(1, NUM_CUSTOMERS + 1):
-        first_name = fake.first_name()
-        last_name = fake.last_name()
-        email = f"{first_name.lower()}.{last_name.lower()}@{fake.domain_name()}"
-        phone = fake.phone_number()
-        address = fake.street_address()
-        city = fake.city()
-        state = fake.state_abbr()
-        zip_code = fake.zipcode()
-        country = "USA"
-        registration_date = fake.date_between(start_date='-3y', end_date='today')
-        
-        writer.writerow([i, first_name, last_name, email, phone, address, city, state, zip_code, country, registration_date])
-        customers.append(i)
+    writer.writerows(zip(customers, first_names, last_names, emails, phones, addresses, cities, states, zip_codes, countries, registration_dates))
 
 # 4. Generate orders.csv
 print("4. Generating orders.csv...")
 orders = []
 order_statuses = ["Pending", "Processing", "Shipped", "Delivered", "Cancelled"]
-start_date = datetime.now() - timedelta(days=365)
-
-with open('orders.csv', 'w', newline='', encoding='utf-8') as f:
-    writer = csv.writer(f)
-    writer.writerow(['order_id', 'customer_id', 'order_date', 'status', 'shipping_address', 'shipping_city', 'shipping_state', 'shipping_zip', 'total_amount'])
+order_dates = random_dates(365, NUM_ORDERS)
+shipping_addresses = random.choices(street_address_pool, k=NUM_ORDERS)
+shipping_cities = random.choices(city_pool, k=NUM_ORDERS)
+shipping_states = random.choices(state_pool, k=NUM_ORDERS)
+shipping_zips = random.choices(zipcode_pool, k=NUM_ORDERS)
+
+# Orders are kept in memory and written once order_items has produced the totals
+order_rows = []
+for i in range(1, NUM_ORDERS + 1):
+    customer_id = random.choice(customers)
+    # Order date should be after customer registration
+    order_date = order_dates[i - 1]
+    status = random.choice(order_statuses)
+    # Weight statuses towards delivered (more realistic)
+    if random.random() < 0.6:
+        status = "Delivered"
+    elif random.random() < 0.8:
+        status = "Shipped"
     
-    for i in range(1, NUM_ORDERS + 1):
-        customer_id = random.choice(customers)
-        # Order date should be after customer registration
-        order_date = fake.date_between(start_date='-1y', end_date='today')
-        status = random.choice(order_statuses)
-        # Weight statuses towards delivered (more realistic)
-        if random.random() < 0.6:
-            status = "Delivered"
-        elif random.random() < 0.8:
-            status = "Shipped"
-        
-        shipping_address = fake.street_address()
-        shipping_city = fake.city()
-        shipping_state = fake.state_abbr()
-        shipping_zip = fake.zipcode()
-        
-        # Total amount will be calculated from order items, but we'll set a placeholder
-        # It will be updated after generating order_items
-        total_amount = 0.0
-        
-        writer.writerow([i, customer_id, order_date, status, shipping_address, shipping_city, shipping_state, shipping_zip, total_amount])
-        orders.append(i)
+    shipping_address = shipping_addresses[i - 1]
+    shipping_city = shipping_cities[i - 1]
+    shipping_state = shipping_states[i - 1]
+    shipping_zip = shipping_zips[i - 1]
+    
+    # Total amount is filled in after generating order_items
+    total_amount = 0.0
+    
+    order_rows.append([i, customer_id, order_date, status, shipping_address, shipping_city, shipping_state, shipping_zip, total_amount])
+    orders.append(i)
 
-# 5. Generate order_items.csv and update order totals
+# 5. Generate order_items.csv and compute order totals
 print("5. Generating order_items.csv...")
 order_totals = {}
 
-with open('order_items.csv', 'w', newline='', encoding='utf-8') as f:
+# Pre-draw the numeric values so the loop below only does arithmetic
+item_counts = [min(num_items, len(products))
+               for num_items in random.choices(range(MIN_ORDER_ITEMS, MAX_ORDER_ITEMS + 1), k=NUM_ORDERS)]
+total_items = sum(item_counts)
+quantities = random.choices(range(1, 6), k=total_items)
+# Get product price (simplified - in real scenario would query products table)
+# Using a reasonable price range
+unit_prices = [round(random.uniform(9.99, 299.99), 2) for _ in range(total_items)]
+# Draw the product for every line item at once; the rare order that drew
+# the same product twice is redrawn without replacement below
+product_picks = random.choices(products, k=total_items)
+
+with open('order_items.csv', 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
     writer = csv.writer(f)
     writer.writerow(['order_item_id', 'order_id', 'product_id', 'quantity', 'unit_price', 'subtotal'])
     
+    order_item_rows = []
     order_item_id = 1
-    for order_id in orders:
-        num_items = random.randint(MIN_ORDER_ITEMS, MAX_ORDER_ITEMS)
+    for order_id, num_items in zip(orders, item_counts):
         order_total = 0.0
         
-        selected_products = random.sample(products, min(num_items, len(products)))
+        selected_products = product_picks[order_item_id - 1:order_item_id - 1 + num_items]
+        if len(set(selected_products)) < num_items:
+            selected_products = random.sample(products, num_items)
         
         for product_id in selected_products:
-            quantity = random.randint(1, 5)
-            # Get product price (simplified - in real scenario would query products table)
-            # Using a reasonable price range
-            unit_price = round(random.uniform(9.99, 299.99), 2)
+            quantity = quantities[order_item_id - 1]
+            unit_price = unit_prices[order_item_id - 1]
             subtotal = round(unit_price * quantity, 2)
             order_total += subtotal
             
-            writer.writerow([order_item_id, order_id, product_id, quantity, unit_price, subtotal])
+            order_item_rows.append([order_item_id, order_id, product_id, quantity, unit_price, subtotal])
             order_item_id += 1
         
         order_totals[order_id] = round(order_total, 2)
+    writer.writerows(order_item_rows)
+
+# Write orders.csv with the totals computed from order_items
+for row in order_rows:
+    row[8] = order_totals.get(row[0], 0.0)  # total_amount
 
-# Update orders.csv with correct totals
-print("6. Updating orders.csv with totals...")
-rows = []
-with open('orders.csv', 'r', newline='', encoding='utf-8') as f:
-    reader = csv.reader(f)
-    header = next(reader)
-    rows.append(header)
-    for row in reader:
-        order_id = int(row[0])
-        row[8] = order_totals.get(order_id, 0.0)  # Update total_amount
-        rows.append(row)
-
-with open('orders.csv', 'w', newline='', encoding='utf-8') as f:
+with open('orders.csv', 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
     writer = csv.writer(f)
-    writer.writerows(rows)
+    writer.writerow(['order_id', 'customer_id', 'order_date', 'status', 'shipping_address', 'shipping_city', 'shipping_state', 'shipping_zip', 'total_amount'])
+    writer.writerows(order_rows)
 
 print("\n✅ Data generation complete!")
 print(f"Generated files:")
@@ -6,6 +6,7 @@ Creates ecom.db and imports all CSV files as tables.
 import csv
 import sqlite3
 import os
+import sys
 from pathlib import Path
 
 # Database file name
@@ -21,6 +22,81 @@ CSV_FILES = [
     ('payments.csv', 'payments'),  # Optional - will skip if doesn't exist
 ]
 
+# Known table schemas; create_table falls back to sampling the CSV for anything else
+SCHEMAS = {
+    'categories': {
+        'category_id': 'INTEGER PRIMARY KEY',
+        'category_name': 'TEXT',
+        'description': 'TEXT',
+    },
+    'customers': {
+        'customer_id': 'INTEGER PRIMARY KEY',
+        'first_name': 'TEXT',
+        'last_name': 'TEXT',
+        'email': 'TEXT',
+        'phone': 'TEXT',
+        'address': 'TEXT',
+        'city': 'TEXT',
+        'state': 'TEXT',
+        'zip_code': 'TEXT',
+        'country': 'TEXT',
+        'registration_date': 'TEXT',
+    },
+    'products': {
+        'product_id': 'INTEGER PRIMARY KEY',
+        'product_name': 'TEXT',
+        'description': 'TEXT',
+        'price': 'REAL',
+        'category_id': 'INTEGER REFERENCES categories(category_id)',
+        'stock_quantity': 'INTEGER',
+        'created_date': 'TEXT',
+    },
+    'orders': {
+        'order_id': 'INTEGER PRIMARY KEY',
+        'customer_id': 'INTEGER REFERENCES customers(customer_id)',
+        'order_date': 'TEXT',
+        'status': 'TEXT',
+        'shipping_address': 'TEXT',
+        'shipping_city': 'TEXT',
+        'shipping_state': 'TEXT',
+        'shipping_zip': 'TEXT',
+        'total_amount': 'REAL',
+    },
+    'order_items': {
+        'order_item_id': 'INTEGER PRIMARY KEY',
+        'order_id': 'INTEGER REFERENCES orders(order_id)',
+        'product_id': 'INTEGER REFERENCES products(product_id)',
+        'quantity': 'INTEGER',
+        'unit_price': 'REAL',
+        'subtotal': 'REAL',
+    },
+    'payments': {
+        'payment_id': 'INTEGER PRIMARY KEY',
+        'order_id': 'INTEGER REFERENCES orders(order_id)',
+        'payment_method': 'TEXT',
+        'payment_date': 'TEXT',
+        'amount': 'REAL',
+        'payment_status': 'TEXT',
+    },
+}
+
+# Durability is switched off while the database is rebuilt from scratch:
+# there is no rollback journal and no fsync on commit. If the import is
+# interrupted the database may be left corrupt - recovery is to rerun the script.
+BULK_LOAD_PRAGMAS = [
+    "PRAGMA journal_mode=OFF",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-200000",  # ~200 MB page cache
+    "PRAGMA locking_mode=EXCLUSIVE",
+]
+
+# Normal durability settings restored once the import is complete
+POST_LOAD_PRAGMAS = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+]
+
 def get_csv_headers(csv_file):
     """Read the first line of CSV to get column headers."""
     with open(csv_file, 'r', encoding='utf-8') as f:
@@ -52,19 +128,19 @@ def infer_sqlite_type(value):
 
 def get_column_types(csv_file, num_samples=10):
     """Determine column types by sampling rows."""
-    headers = get_csv_headers(csv_file)
     types = {}
     
     with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        headers = next(reader)
         samples = []
         for i, row in enumerate(reader):
             if i >= num_samples:
                 break
             samples.append(row)
     
-    for header in headers:
-        sample_values = [row[header] for row in samples if header in row and row[header]]
+    for index, header in enumerate(headers):
+        sample_values = [row[index] for row in samples if index < len(row) and row[index]]
         if sample_values:
             types[header] = infer_sqlite_type(sample_values[0])
         else:
@@ -72,18 +148,21 @@ def get_column_types(csv_file, num_samples=10):
     
     return types
 
-def create_table(conn, table_name, csv_file):
+def create_table(conn, table_name, csv_file, headers):
     """Create a table based on CSV file structure."""
-    headers = get_csv_headers(csv_file)
-    types = get_column_types(csv_file)
-    
-    # Create column definitions
-    columns = []
-    for header in headers:
-        sql_type = types.get(header, 'TEXT')
-        # Clean header name for SQL (replace spaces, special chars)
-        clean_header = header.replace(' ', '_').replace('-', '_').lower()
-        columns.append(f'"{clean_header}" {sql_type}')
+    schema = SCHEMAS.get(table_name)
+    if schema is not None:
+        columns = [f'"{name}" {sql_type}' for name, sql_type in schema.items()]
+    else:
+        types = get_column_types(csv_file)
+        
+        # Create column definitions
+        columns = []
+        for header in headers:
+            sql_type = types.get(header, 'TEXT')
+            # Clean header name for SQL (replace spaces, special chars)
+            clean_header = header.replace(' ', '_').replace('-', '_').lower()
+            columns.append(f'"{clean_header}" {sql_type}')
     
     # Create table SQL
     create_sql = f'''
@@ -93,58 +172,54 @@ def create_table(conn, table_name, csv_file):
     '''
     
     conn.execute(create_sql)
-    conn.commit()
     print(f"  ✓ Created table: {table_name}")
 
-def import_csv_data(conn, table_name, csv_file):
+def import_csv_data(conn, table_name, csv_file, headers):
     """Import data from CSV file into SQLite table."""
-    headers = get_csv_headers(csv_file)
     clean_headers = [h.replace(' ', '_').replace('-', '_').lower() for h in headers]
     
-    # Count rows first
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        row_count = sum(1 for line in f) - 1  # Subtract header
-    
     # Prepare insert statement
+    num_columns = len(headers)
     placeholders = ','.join(['?' for _ in headers])
     quoted_headers = ','.join([f'"{h}"' for h in clean_headers])
     insert_sql = f'INSERT INTO {table_name} ({quoted_headers}) VALUES ({placeholders})'
     
-    # Read and insert data
-    inserted = 0
-    with open(csv_file, 'r', encoding='utf-8') as f:
+    # Stream rows straight from the reader into a single executemany call
+    with open(csv_file, 'r', encoding='utf-8', newline='', buffering=1 << 20) as f:
         reader = csv.reader(f)
         next(reader)  # Skip header
         
-        batch = []
-        for row in reader:
-            # Ensure row has same length as headers (pad with None if needed)
-            while len(row) < len(headers):
-                row.append(None)
-            batch.append(row[:len(headers)])
-            
-            # Insert in batches of 1000
-            if len(batch) >= 1000:
-                conn.executemany(insert_sql, batch)
-                inserted += len(batch)
-                batch = []
+        def row_iter():
+            for row in reader:
+                # Well-formed rows go straight to SQLite without being copied
+                if len(row) == num_columns:
+                    yield row
+                # Ensure row has same length as headers (pad with None if needed)
+                elif len(row) < num_columns:
+                    yield row + [None] * (num_columns - len(row))
+                else:
+                    yield row[:num_columns]
         
-        # Insert remaining rows
-        if batch:
-            conn.executemany(insert_sql, batch)
-            inserted += len(batch)
+        # No rollback on failure: the journal is off during the bulk load, so
+        # ROLLBACK is undefined and main() aborts the import instead
+        conn.execute('BEGIN IMMEDIATE')
+        cursor = conn.executemany(insert_sql, row_iter())
+        inserted = cursor.rowcount
+        conn.execute('COMMIT')
     
-    conn.commit()
     print(f"  ✓ Imported {inserted} rows into {table_name}")
 
 def create_indexes(conn):
     """Create useful indexes for common queries."""
     indexes = [
-        "CREATE INDEX IF NOT EXISTS idx_orders_customer_id ON orders(customer_id);",
+        # Covers the customers -> orders join (also serves customer_id lookups)
+        "CREATE INDEX IF NOT EXISTS idx_orders_customer ON orders(customer_id, order_id);",
         "CREATE INDEX IF NOT EXISTS idx_orders_order_date ON orders(order_date);",
         "CREATE INDEX IF NOT EXISTS idx_order_items_order_id ON order_items(order_id);",
         "CREATE INDEX IF NOT EXISTS idx_order_items_product_id ON order_items(product_id);",
         "CREATE INDEX IF NOT EXISTS idx_products_category_id ON products(category_id);",
+        # Indexed search for the orders -> payments join instead of scanning payments
+        "CREATE INDEX IF NOT EXISTS idx_payments_order_status ON payments(order_id, payment_status, amount);",
     ]
     
     for index_sql in indexes:
@@ -153,7 +228,8 @@ def create_indexes(conn):
         except sqlite3.OperationalError as e:
             print(f"  ⚠ Could not create index: {e}")
     
-    conn.commit()
+    # Gather table/index statistics so the query planner can pick good join orders
+    conn.execute("ANALYZE")
     print("  ✓ Created indexes")
 
 def main():
@@ -169,6 +245,9 @@ def main():
     
     # Create database connection
     conn = sqlite3.connect(DB_NAME)
+    conn.isolation_level = None  # Autocommit; import_csv_data issues explicit BEGIN/COMMIT
+    for pragma in BULK_LOAD_PRAGMAS:
+        conn.execute(pragma)
     print(f"\nCreated database: {DB_NAME}\n")
     
     # Import each CSV file
@@ -183,17 +262,23 @@ def main():
         
         print(f"Processing {csv_file}...")
         try:
-            create_table(conn, table_name, csv_file)
-            import_csv_data(conn, table_name, csv_file)
+            headers = get_csv_headers(csv_file)
+            create_table(conn, table_name, csv_file, headers)
+            import_csv_data(conn, table_name, csv_file, headers)
             imported_count += 1
             print()
         except Exception as e:
+            # See BULK_LOAD_PRAGMAS: recovery is to rerun the script
             print(f"  ✗ Error importing {csv_file}: {e}\n")
-            skipped_count += 1
+            print(f"Import aborted - rerun the script to rebuild {DB_NAME}")
+            conn.close()
+            sys.exit(1)
     
     # Create indexes
     print("Creating indexes...")
     create_indexes(conn)
+    for pragma in POST_LOAD_PRAGMAS:
+        conn.execute(pragma)
     print()
     
     # Print summary
@@ -207,7 +292,7 @@ def main():
     
     # Show table info
     cursor = conn.cursor()
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")
     tables = cursor.fetchall()
     
     print("\nTables in database:")
@@ -6,7 +6,7 @@ cursor = conn.cursor()
 
 print("Database Tables and Row Counts:")
 print("=" * 50)
-cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
+cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name")
 tables = cursor.fetchall()
 
 for table in tables: